@@ -200,6 +200,22 @@ def get_wiki_summary(page_title):
         print(f"Error getting Wikipedia summary: {str(e)}")
         return None
 
+def iter_article_paragraphs(soup, url):
+    """Yield the stripped paragraph texts of a scraped Wikipedia page, one at a time."""
+    # Handle main page content
+    if 'Main_Page' in url:
+        sections = soup.select('div.mw-parser-output > p')
+        if not sections:
+            sections = soup.select('div#mp-upper p, div#mp-tfa p, div#mp-itn p')
+        
+        for section in sections[:10]:
+            if section.text.strip():
+                yield section.text.strip()
+    else:
+        # Handle regular article content
+        for paragraph in soup.select('div.mw-parser-output > p'):
+            yield paragraph.text.strip()
+
 def get_article_content(url):
     """Scrape content from a Wikipedia article or main page."""
     try:
@@ -227,21 +243,7 @@ def get_article_content(url):
         title_elem = soup.find('h1', {'id': 'firstHeading'}) or soup.find('h1', {'class': 'firstHeading'})
         title = title_elem.text if title_elem else "Wikipedia Article"
         
-        # Handle main page content
-        if 'Main_Page' in url:
-            content = ""
-            sections = soup.select('div.mw-parser-output > p')
-            if not sections:
-                sections = soup.select('div#mp-upper p, div#mp-tfa p, div#mp-itn p')
-            
-            for section in sections[:10]:
-                if section.text.strip():
-                    content += section.text.strip() + "\n\n"
-        else:
-            # Handle regular article content
-            content = ""
-            for paragraph in soup.select('div.mw-parser-output > p'):
-                content += paragraph.text.strip() + "\n\n"
+        content = "".join(p + "\n\n" for p in iter_article_paragraphs(soup, url))
         
         if not content.strip():
             return {
@@ -266,42 +268,80 @@ def get_article_content(url):
         st.error(f"Error fetching article: {str(e)}")
         return None
 
-def analyze_text(text):
-    """Analyze the text and return various metrics."""
-    try:
-        # Basic text analysis
-        blob = TextBlob(text)
-        sentences = sent_tokenize(text)
-        words = word_tokenize(text)
-        word_count = len(words)
-        sentence_count = len(sentences)
-        
-        # Calculate average sentence length
-        avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
+def count_syllables(word):
+    """Count syllables in a word (simplified: runs of vowels, minimum one)."""
+    word = word.lower()
+    count = len(re.findall(r'[aeiouy]+', word))
+    return max(1, count)
+
+class StreamingTextAnalyzer:
+    """Compute the analyze_text metrics incrementally from chunks of text.
+
+    Only running totals are kept, so memory stays constant no matter how much
+    text is fed in. Sentiment is the mean of TextBlob's per-assessment scores,
+    which is how TextBlob scores a whole document. Chunks are analyzed
+    independently, so feed whole paragraphs: a sentence or negation split
+    across two chunks is counted as if it ended at the boundary.
+    """
+
+    def __init__(self):
+        self.word_count = 0
+        self.sentence_count = 0
+        self.syllable_count = 0
+        self.complex_word_count = 0
+        self.polarity_sum = 0.0
+        self.subjectivity_sum = 0.0
+        self.assessment_count = 0
+
+    def update(self, chunk):
+        """Add a chunk of text (e.g. a paragraph) to the running totals."""
+        if not chunk or not chunk.strip():
+            return self
         
-        # Sentiment analysis
-        sentiment = blob.sentiment
+        self.sentence_count += len(sent_tokenize(chunk))
+        for word in word_tokenize(chunk):
+            syllables = count_syllables(word)
+            self.word_count += 1
+            self.syllable_count += syllables
+            # Complex words have more than 2 syllables
+            if syllables > 2:
+                self.complex_word_count += 1
         
-        # Count syllables (simplified)
-        def count_syllables(word):
-            word = word.lower()
-            count = len(re.findall(r'[aeiouy]+', word))
-            return max(1, count)
-            
-        # Count complex words (more than 2 syllables)
-        complex_words = [word for word in words if count_syllables(word) > 2]
-        complex_word_count = len(complex_words)
+        for _, polarity, subjectivity, _ in TextBlob(chunk).sentiment_assessments.assessments:
+            self.polarity_sum += polarity
+            self.subjectivity_sum += subjectivity
+            self.assessment_count += 1
+        return self
+
+    def result(self):
+        """Return the metrics for everything seen so far; safe to call mid-stream."""
+        word_count = self.word_count
+        sentence_count = self.sentence_count
+        avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
+        polarity = self.polarity_sum / self.assessment_count if self.assessment_count else 0.0
+        subjectivity = self.subjectivity_sum / self.assessment_count if self.assessment_count else 0.0
         
         return {
             'word_count': word_count,
             'sentence_count': sentence_count,
             'avg_sentence_length': round(avg_sentence_length, 2),
-            'complex_word_count': complex_word_count,
-            'complex_word_percentage': round((complex_word_count / word_count) * 100, 2) if word_count > 0 else 0,
-            'polarity': round(sentiment.polarity, 2),
-            'subjectivity': round(sentiment.subjectivity, 2),
+            'complex_word_count': self.complex_word_count,
+            'complex_word_percentage': round((self.complex_word_count / word_count) * 100, 2) if word_count > 0 else 0,
+            'polarity': round(polarity, 2),
+            'subjectivity': round(subjectivity, 2),
             'reading_time': round(word_count / 200, 1)  # Average reading speed: 200 words per minute
         }
+
+def analyze_text_stream(chunks):
+    """Analyze an iterable of text chunks, yielding the running metrics after each one."""
+    analyzer = StreamingTextAnalyzer()
+    for chunk in chunks:
+        yield analyzer.update(chunk).result()
+
+def analyze_text(text):
+    """Analyze the text and return various metrics."""
+    try:
+        return StreamingTextAnalyzer().update(text).result()
     except Exception as e:
         st.error(f"Error analyzing text: {str(e)}")
         return None